@@ -0,0 +1,99 @@
+"""
+Pickled sidecar cache of parsed YAML configuration files
+
+Shared by fastExport.py and fastDelete.py, so both scripts agree on the cache
+key, the on-disk format and the ownership/permission checks of the sidecar.
+"""
+
+import os
+import hashlib
+import pickle
+import stat
+from typing import Any
+
+
+def file_signature(path: str, s: os.stat_result) -> tuple:
+    """Build the cache key used to detect changes to a YAML file
+
+    (mtime_ns, size, inode) catches normal edits as well as atomic rewrites
+    that replace the file. With HERMETIC_CONFIG_CACHE=1 in the environment a
+    digest of the first 64 KiB is added, for filesystems with coarse mtimes.
+    """
+    signature = (s.st_mtime_ns, s.st_size, s.st_ino)
+    if os.environ.get('HERMETIC_CONFIG_CACHE') == '1':
+        with open(path, 'rb') as file:
+            signature += (hashlib.blake2b(file.read(65536), digest_size=16).digest(),)
+    return signature
+
+
+def parse_yaml(path: str) -> Any:
+    """Parse a YAML file
+
+    yaml is imported here rather than at module level so that runs served
+    from the pickled config never pay for the import.
+    """
+    import yaml
+    # Prefer the libyaml-backed loader when available, it is several times faster
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+
+    with open(path, 'r') as file:
+        try:
+            return yaml.load(file, Loader=SafeLoader)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Error parsing YAML file '{path}': {e}") from e
+
+
+def _sidecar_mode(s: os.stat_result) -> int:
+    """Permissions of the pickled copy of a YAML file with stat result s
+
+    Those of the YAML file (it holds the same credentials), never writable or
+    executable by group/other, and always read/write for the owner.
+    """
+    return (stat.S_IMODE(s.st_mode) & 0o644) | 0o600
+
+
+def load_yaml_with_sidecar(path: str, s: os.stat_result, signature: tuple) -> Any:
+    """Parse a YAML file, preferring a pickled copy next to it when that is up to date
+
+    The pickle is stored as '<path>.cache.pkl' together with the signature of
+    the YAML file it was built from, and is only trusted when that signature
+    still matches. Unpickling can run code, so the sidecar is also ignored
+    unless it has the YAML file's owner and the mode it is written with.
+    Any problem reading or writing the sidecar silently falls back to parsing
+    the YAML.
+    """
+    cache_path = path + '.cache.pkl'
+    mode = _sidecar_mode(s)
+
+    try:
+        fd = os.open(cache_path, os.O_RDONLY | getattr(os, 'O_NOFOLLOW', 0))
+        with os.fdopen(fd, 'rb') as cache_file:
+            cache_stat = os.fstat(cache_file.fileno())
+            if cache_stat.st_uid == s.st_uid and stat.S_IMODE(cache_stat.st_mode) == mode:
+                cached_signature, data = pickle.load(cache_file)
+                if cached_signature == signature:
+                    return data
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass
+
+    data = parse_yaml(path)
+
+    # Write to a private temporary file and rename it over the sidecar, so the
+    # credentials are never readable by others and a planted file is replaced
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'wb') as cache_file:
+            pickle.dump((signature, data), cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+    return data
@@ -21,18 +21,81 @@ Usage:
 """
 
 import os
+import sys
+import copy
+import re
+import threading
 import oracledb
 import datetime
 import argparse
-import yaml
-from typing import List, Dict, Any, Tuple
+from collections import OrderedDict, defaultdict
+from typing import List, Dict, Any, Tuple, Callable
+
+from config_cache import file_signature, load_yaml_with_sidecar
+
+# Parsed YAML files keyed by absolute path, invalidated by file_signature
+_YAML_CACHE: "OrderedDict[str, Tuple[tuple, Any]]" = OrderedDict()
+_CACHE_MAX = 100
+_YAML_CACHE_LOCK = threading.Lock()
+
+# Parsed table specification: (owner, table_name, qualified_table_name)
+TableSpec = Tuple[str, str, str]
+
+# User input formats accepted by prompt_for_pk_values
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_INT_RE = re.compile(r'^-?\d+$')
+_FLOAT_RE = re.compile(r'^-?\d+\.\d+$')
+
+# Statements kept prepared per connection
+_STATEMENT_CACHE_SIZE = 50
+
+# Rows fetched per round-trip by SELECT cursors
+_FETCH_ARRAYSIZE = 1000
+
+# Column types whose values are fetched as str and truncated in the preview
+_PREVIEW_TEXT_TYPES = frozenset((
+    oracledb.DB_TYPE_VARCHAR,
+    oracledb.DB_TYPE_NVARCHAR,
+    oracledb.DB_TYPE_CHAR,
+    oracledb.DB_TYPE_NCHAR,
+    oracledb.DB_TYPE_LONG,
+))
+
+# Preview row counts stop at this many rows instead of scanning the whole table
+_PREVIEW_COUNT_CAP = 10000
+
+
+def _read_yaml_cached(path: str) -> Any:
+    """Parse a YAML file, reusing the previous result while the file is unchanged
+
+    A deep copy is returned so callers can freely modify the result
+    without corrupting the cached entry.
+    """
+    path = os.path.abspath(path)
+    s = os.stat(path)
+    signature = file_signature(path, s)
+
+    with _YAML_CACHE_LOCK:
+        cached = _YAML_CACHE.get(path)
+        if cached is not None and cached[0] == signature:
+            _YAML_CACHE.move_to_end(path)
+            return copy.deepcopy(cached[1])
+
+    data = load_yaml_with_sidecar(path, s, signature)
+
+    with _YAML_CACHE_LOCK:
+        _YAML_CACHE[path] = (signature, data)
+        _YAML_CACHE.move_to_end(path)
+        if len(_YAML_CACHE) > _CACHE_MAX:
+            _YAML_CACHE.popitem(last=False)
+
+    return copy.deepcopy(data)
 
 
 def load_config(config_file: str) -> Dict[str, Any]:
     """Load configuration from YAML file"""
     try:
-        with open(config_file, 'r') as file:
-            config = yaml.safe_load(file)
+        config = _read_yaml_cached(config_file)
 
         # Validate required sections
         if 'database' not in config:
@@ -62,9 +125,6 @@ def load_config(config_file: str) -> Dict[str, Any]:
     except FileNotFoundError:
         print(f"Error: Configuration file '{config_file}' not found")
         raise
-    except yaml.YAMLError as e:
-        print(f"Error parsing YAML file '{config_file}': {e}")
-        raise
     except Exception as e:
         print(f"Error loading configuration: {e}")
         raise
@@ -73,7 +133,9 @@ def load_config(config_file: str) -> Dict[str, Any]:
 def connect_to_database(username: str, password: str, dsn: str) -> oracledb.Connection:
     """Establish connection to Oracle database"""
     try:
-        connection = oracledb.connect(user=username, password=password, dsn=dsn)
+        # Statement cache lets repeated metadata queries skip re-parsing
+        connection = oracledb.connect(user=username, password=password, dsn=dsn,
+                                      stmtcachesize=_STATEMENT_CACHE_SIZE)
         print(f"Successfully connected to Oracle Database {connection.version}")
         return connection
     except oracledb.Error as error:
@@ -81,30 +143,76 @@ def connect_to_database(username: str, password: str, dsn: str) -> oracledb.Conn
         raise
 
 
+def _new_cursor(connection: oracledb.Connection) -> oracledb.Cursor:
+    """Open a cursor tuned for SELECTs, fetching up to _FETCH_ARRAYSIZE rows per round-trip"""
+    cursor = connection.cursor()
+    cursor.arraysize = _FETCH_ARRAYSIZE
+    cursor.prefetchrows = _FETCH_ARRAYSIZE + 1
+    return cursor
+
+
+# Cursor shared by the metadata queries, see _metadata_cursor
+_METADATA_CURSOR = None
+
+
+def _metadata_cursor(connection: oracledb.Connection) -> oracledb.Cursor:
+    """Return the shared metadata cursor for a connection, opening it on first use"""
+    global _METADATA_CURSOR
+    if _METADATA_CURSOR is None or _METADATA_CURSOR.connection is not connection:
+        close_metadata_cursor()
+        _METADATA_CURSOR = _new_cursor(connection)
+    return _METADATA_CURSOR
+
+
+def close_metadata_cursor() -> None:
+    """Close the shared metadata cursor if one is open"""
+    global _METADATA_CURSOR
+    if _METADATA_CURSOR is not None:
+        try:
+            _METADATA_CURSOR.close()
+        except oracledb.Error:
+            pass  # The connection may already be closed
+        _METADATA_CURSOR = None
+
+
+def _row_to_column(row: Tuple[Any, ...]) -> Dict[str, Any]:
+    """Convert a column metadata row into the column dictionary used throughout the script"""
+    return {
+        'name': row[0],
+        'data_type': row[1],
+        'data_length': row[2],
+        'data_precision': row[3],
+        'data_scale': row[4],
+        'nullable': row[5] == 'Y',
+        'is_pk': row[6] == 1
+    }
+
+
 def get_table_columns(connection: oracledb.Connection, owner: str, table_name: str) -> List[Dict[str, Any]]:
     """Get column information including primary key status for a table"""
-    cursor = connection.cursor()
+    cursor = _metadata_cursor(connection)
     
     query = """
-    SELECT DISTINCT
+    SELECT
         c.column_name, 
         c.data_type,
         c.data_length,
         c.data_precision,
         c.data_scale,
         c.nullable,
-        CASE WHEN EXISTS (
-            SELECT 1 
+        CASE WHEN pk.column_name IS NOT NULL THEN 1 ELSE 0 END AS is_pk,
+        c.column_id
+    FROM 
+        all_tab_columns c
+        LEFT JOIN (
+            SELECT cc.column_name
             FROM all_cons_columns cc
             INNER JOIN all_constraints con ON cc.constraint_name = con.constraint_name
+                                          AND cc.owner = con.owner
             WHERE con.constraint_type = 'P'
               AND cc.table_name = :table_name
               AND cc.owner = :owner
-              AND cc.column_name = c.column_name
-        ) THEN 1 ELSE 0 END AS is_pk,
-        c.column_id
-    FROM 
-        all_tab_columns c
+        ) pk ON pk.column_name = c.column_name
     WHERE 
         c.table_name = :table_name
         AND c.owner = :owner
@@ -113,23 +221,107 @@ def get_table_columns(connection: oracledb.Connection, owner: str, table_name: s
     """
     
     cursor.execute(query, table_name=table_name.upper(), owner=owner.upper())
-    columns = []
-    
-    for row in cursor:
-        columns.append({
-            'name': row[0],
-            'data_type': row[1],
-            'data_length': row[2],
-            'data_precision': row[3],
-            'data_scale': row[4],
-            'nullable': row[5] == 'Y',
-            'is_pk': row[6] == 1
-        })
+    columns = [_row_to_column(row) for row in cursor]
     
-    cursor.close()
     return columns
 
 
+def get_all_table_columns(connection: oracledb.Connection,
+                          owner_table_pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
+    """Get column information for several tables with one query per owner
+
+    The table names of each owner are bound as a single SYS.ODCIVARCHAR2LIST
+    collection, so the statement text is the same for every call and any
+    number of tables can be looked up at once.
+
+    Args:
+        connection: Open database connection
+        owner_table_pairs: List of (owner, table_name) tuples
+
+    Returns:
+        Dictionary mapping (owner, table_name) to the same column list that
+        get_table_columns returns. Tables that are not found map to an empty list.
+    """
+    pairs = list(dict.fromkeys((owner.upper(), table.upper()) for owner, table in owner_table_pairs))
+    columns_by_table = {pair: [] for pair in pairs}
+    if not pairs:
+        return columns_by_table
+
+    tables_by_owner = defaultdict(list)
+    for owner, table_name in pairs:
+        tables_by_owner[owner].append(table_name)
+
+    query = """
+    SELECT
+        c.column_name,
+        c.data_type,
+        c.data_length,
+        c.data_precision,
+        c.data_scale,
+        c.nullable,
+        CASE WHEN pk.column_name IS NOT NULL THEN 1 ELSE 0 END AS is_pk,
+        c.column_id,
+        c.owner,
+        c.table_name
+    FROM
+        all_tab_columns c
+        LEFT JOIN (
+            SELECT cc.table_name, cc.column_name
+            FROM all_cons_columns cc
+            INNER JOIN all_constraints con ON cc.constraint_name = con.constraint_name
+                                          AND cc.owner = con.owner
+            WHERE con.constraint_type = 'P'
+              AND cc.owner = :owner
+              AND cc.table_name IN (SELECT column_value FROM TABLE(:table_names))
+        ) pk ON pk.table_name = c.table_name
+            AND pk.column_name = c.column_name
+    WHERE
+        c.owner = :owner
+        AND c.table_name IN (SELECT column_value FROM TABLE(:table_names))
+    ORDER BY
+        c.table_name, c.column_id
+    """
+
+    cursor = _metadata_cursor(connection)
+    list_type = connection.gettype('SYS.ODCIVARCHAR2LIST')
+
+    for owner, table_names in tables_by_owner.items():
+        cursor.execute(query, owner=owner, table_names=list_type.newobject(table_names))
+        for row in cursor:
+            columns_by_table[(row[8], row[9])].append(_row_to_column(row))
+
+    return columns_by_table
+
+
+def _parse_number(value: str) -> Any:
+    """Convert user input for a NUMBER column to int or float"""
+    value = value.strip()
+    if _INT_RE.match(value):
+        return int(value)
+    if _FLOAT_RE.match(value):
+        return float(value)
+    raise ValueError("Invalid input for NUMBER. Please try again.")
+
+
+def _parse_date(value: str) -> str:
+    """Validate user input for a DATE/TIMESTAMP column, returning it unchanged"""
+    if not _DATE_RE.match(value):
+        raise ValueError("Date format should be YYYY-MM-DD (e.g., 2024-12-25)")
+    try:
+        datetime.datetime.strptime(value, '%Y-%m-%d')
+    except ValueError:
+        raise ValueError("Invalid date. Please use format YYYY-MM-DD (e.g., 2024-12-25)") from None
+    return value
+
+
+# Input validators per Oracle data type, each returns the value to filter on or raises ValueError
+_VALIDATORS: Dict[str, Callable[[str], Any]] = {
+    'NUMBER': _parse_number,
+    'DATE': _parse_date,
+    'TIMESTAMP': _parse_date,
+}
+
+
 def prompt_for_pk_values(pk_columns: List[Dict[str, Any]], table_name: str) -> Dict[str, Any]:
     """Prompt the user to enter values for primary key columns"""
     pk_values = {}
@@ -150,6 +342,8 @@ def prompt_for_pk_values(pk_columns: List[Dict[str, Any]], table_name: str) -> D
     for col in pk_columns:
         col_name = col['name']
         data_type = col['data_type']
+        # All other data types are treated as strings
+        validate = _VALIDATORS.get(data_type, str)
         
         valid_input = False
         while not valid_input:
@@ -166,34 +360,11 @@ def prompt_for_pk_values(pk_columns: List[Dict[str, Any]], table_name: str) -> D
                 
             # Basic type validation
             try:
-                if data_type == 'NUMBER':
-                    # Try to convert to a number
-                    if '.' in value:
-                        processed_value = float(value)
-                    else:
-                        processed_value = int(value)
-                    pk_values[col_name] = processed_value
-                elif data_type in ('DATE', 'TIMESTAMP'):
-                    # Validate date format
-                    if len(value) == 10 and value[4] == '-' and value[7] == '-':
-                        # Try to parse the date to validate it
-                        try:
-                            datetime.datetime.strptime(value, '%Y-%m-%d')
-                            pk_values[col_name] = value
-                        except ValueError:
-                            print("❌ Invalid date. Please use format YYYY-MM-DD (e.g., 2024-12-25)")
-                            continue
-                    else:
-                        print("❌ Date format should be YYYY-MM-DD (e.g., 2024-12-25)")
-                        continue
-                else:
-                    # Treat as string for all other data types
-                    pk_values[col_name] = value
-                
+                pk_values[col_name] = validate(value)
                 valid_input = True
                 print(f"  → ✅ Will filter {col_name} = {pk_values[col_name]}")
-            except ValueError:
-                print(f"❌ Invalid input for {data_type}. Please try again.")
+            except ValueError as e:
+                print(f"❌ {e}")
     
     # Summary of what will be deleted
     print(f"\n🎯 DELETION SUMMARY FOR {table_name}:")
@@ -241,70 +412,99 @@ def parse_table_name(table_spec: str) -> tuple[str, str]:
     return owner.upper().strip(), table.upper().strip()
 
 
-def preview_data_to_delete(connection: oracledb.Connection, table_spec: str, 
+def format_row_count(row_count: int) -> str:
+    """Format a row count returned by preview_data_to_delete for display"""
+    if row_count > _PREVIEW_COUNT_CAP:
+        return f"{_PREVIEW_COUNT_CAP}+"
+    return str(row_count)
+
+
+def _format_preview_text(value: Any) -> str:
+    """Format a character value for the preview, truncating long text"""
+    if value is None:
+        return "NULL"
+    return value[:17] + "..." if len(value) > 20 else value
+
+
+def _format_preview_other(value: Any) -> str:
+    """Format a non-character value for the preview"""
+    return "NULL" if value is None else str(value)
+
+
+def _pick_formatter(description: Tuple[Any, ...]) -> Callable[[Any], str]:
+    """Choose the preview formatter for a column from its cursor.description entry"""
+    if description[1] in _PREVIEW_TEXT_TYPES:
+        return _format_preview_text
+    return _format_preview_other
+
+
+def preview_data_to_delete(connection: oracledb.Connection, table: TableSpec, 
                           where_clause: str, bind_params: Dict[str, Any]) -> int:
-    """Preview the data that will be deleted and return row count"""
-    try:
-        owner, table_name = parse_table_name(table_spec)
-    except ValueError as e:
-        print(f"Error: {e}")
-        raise
-    
-    qualified_table_name = f"{owner}.{table_name}"
-    cursor = connection.cursor()
-    
-    # Get row count
-    count_query = f"SELECT COUNT(*) FROM {qualified_table_name}"
-    if where_clause:
-        count_query += f" WHERE {where_clause}"
+    """Preview the data that will be deleted and return row count
+
+    Counting stops after _PREVIEW_COUNT_CAP rows, a returned value above the cap
+    means "at least that many" (see format_row_count).
+    """
+    owner, table_name, qualified_table_name = table
+    cursor = _new_cursor(connection)
+    
+    # Fetch the first few rows together with the (capped) total row count in one query.
+    # The count only selects a constant, so Oracle never buffers whole rows (or their
+    # LOBs) for it, and stops after the cap so large tables are not fully scanned.
+    # The 5-row sample is cross joined to it, an empty sample means nothing matched.
+    # The count comes first, under a quoted alias no real column can clash with.
+    filter_prefix = f"{where_clause} AND " if where_clause else ""
+    preview_query = (
+        'SELECT c."__preview_total", t.* FROM ('
+        'SELECT COUNT(*) AS "__preview_total" FROM ('
+        f"SELECT 1 FROM {qualified_table_name} WHERE {filter_prefix}ROWNUM <= {_PREVIEW_COUNT_CAP + 1}"
+        ")) c CROSS JOIN ("
+        # Limit to first 5 rows for preview
+        f"SELECT * FROM {qualified_table_name} WHERE {filter_prefix}ROWNUM <= 5"
+        ") t"
+    )
     
     if bind_params:
-        cursor.execute(count_query, bind_params)
+        cursor.execute(preview_query, bind_params)
     else:
-        cursor.execute(count_query)
+        cursor.execute(preview_query)
     
-    row_count = cursor.fetchone()[0]
+    rows = cursor.fetchall()
     
-    if row_count == 0:
+    # An empty sample means nothing matched, so no separate COUNT is needed
+    if not rows:
         print(f"📊 No rows found matching the criteria in {qualified_table_name}")
         cursor.close()
         return 0
     
-    # Preview first few rows
-    preview_query = f"SELECT * FROM {qualified_table_name}"
-    if where_clause:
-        preview_query += f" WHERE {where_clause}"
-    preview_query += " AND ROWNUM <= 5"  # Limit to first 5 rows for preview
+    # The total count is the leading column of every row
+    row_count = rows[0][0]
     
     print(f"\n📊 DELETION PREVIEW for {qualified_table_name}:")
-    print(f"   • Total rows to be deleted: {row_count}")
-    
-    if bind_params:
-        cursor.execute(preview_query, bind_params)
-    else:
-        cursor.execute(preview_query)
-    
-    # Get column names
-    columns = get_table_columns(connection, owner, table_name)
-    column_names = [col['name'] for col in columns]
-    
-    print(f"   • Preview of first few rows to be deleted:")
-    print(f"     {' | '.join(column_names)}")
-    print(f"     {'-' * (len(' | '.join(column_names)))}")
-    
-    rows = cursor.fetchall()
-    for row in rows:
-        formatted_row = []
-        for i, value in enumerate(row):
-            if value is None:
-                formatted_row.append("NULL")
-            elif isinstance(value, str) and len(value) > 20:
-                formatted_row.append(value[:17] + "...")
-            else:
-                formatted_row.append(str(value))
-        print(f"     {' | '.join(formatted_row)}")
+    print(f"   • Total rows to be deleted: {format_row_count(row_count)}")
+    
+    # Take names and formatters from the columns SELECT * actually returned, which
+    # can be fewer than the table metadata lists (e.g. invisible columns)
+    description = cursor.description[1:]
+    header = ' | '.join(d[0] for d in description)
+    row_template = "     " + " | ".join(["{}"] * len(description))
+    formatters = [_pick_formatter(d) for d in description]
+    
+    # Build the whole preview and write it at once instead of printing row by row
+    lines = [
+        "   • Preview of first few rows to be deleted:",
+        f"     {header}",
+        f"     {'-' * len(header)}",
+    ]
+    lines.extend(
+        row_template.format(*[fmt(value) for fmt, value in zip(formatters, row[1:])])
+        for row in rows
+    )
+    sys.stdout.write('\n'.join(lines) + '\n')
     
-    if row_count > 5:
+    if row_count > _PREVIEW_COUNT_CAP:
+        print(f"     ... and {_PREVIEW_COUNT_CAP - 5}+ more rows")
+    elif row_count > 5:
         print(f"     ... and {row_count - 5} more rows")
     
     cursor.close()
@@ -315,7 +515,7 @@ def confirm_deletion(table_spec: str, row_count: int, where_clause: str) -> bool
     """Ask user to confirm deletion"""
     print(f"\n⚠️  DELETION CONFIRMATION REQUIRED ⚠️")
     print(f"Table: {table_spec}")
-    print(f"Rows to delete: {row_count}")
+    print(f"Rows to delete: {format_row_count(row_count)}")
     if where_clause:
         print(f"Filter conditions: {where_clause}")
     else:
@@ -324,7 +524,7 @@ def confirm_deletion(table_spec: str, row_count: int, where_clause: str) -> bool
     print(f"\n❗ This action cannot be undone unless you rollback the transaction!")
     
     while True:
-        response = input(f"\nDo you want to DELETE {row_count} rows from {table_spec}? (yes/no): ").lower().strip()
+        response = input(f"\nDo you want to DELETE {format_row_count(row_count)} rows from {table_spec}? (yes/no): ").lower().strip()
         if response in ('yes', 'y'):
             return True
         elif response in ('no', 'n'):
@@ -333,15 +533,9 @@ def confirm_deletion(table_spec: str, row_count: int, where_clause: str) -> bool
             print("Please enter 'yes' or 'no'")
 
 
-def generate_delete_statement(table_spec: str, where_clause: str) -> str:
+def generate_delete_statement(table: TableSpec, where_clause: str) -> str:
     """Generate DELETE statement"""
-    try:
-        owner, table_name = parse_table_name(table_spec)
-    except ValueError as e:
-        print(f"Error: {e}")
-        raise
-    
-    qualified_table_name = f"{owner}.{table_name}"
+    qualified_table_name = table[2]
     
     delete_stmt = f"DELETE FROM {qualified_table_name}"
     if where_clause:
@@ -350,11 +544,12 @@ def generate_delete_statement(table_spec: str, where_clause: str) -> str:
     return delete_stmt
 
 
-def execute_deletion(connection: oracledb.Connection, table_spec: str, 
+def execute_deletion(connection: oracledb.Connection, table: TableSpec, 
                     where_clause: str, bind_params: Dict[str, Any], 
                     dry_run: bool = False, auto_commit: bool = False) -> int:
     """Execute the deletion or generate DELETE statement"""
-    delete_stmt = generate_delete_statement(table_spec, where_clause)
+    delete_stmt = generate_delete_statement(table, where_clause)
+    qualified_table_name = table[2]
     
     if dry_run:
         print(f"\n📝 Generated DELETE statement:")
@@ -374,33 +569,27 @@ def execute_deletion(connection: oracledb.Connection, table_spec: str,
             cursor.execute(delete_stmt)
         
         rows_deleted = cursor.rowcount
-        print(f"✅ Successfully deleted {rows_deleted} rows from {table_spec}")
+        print(f"✅ Successfully deleted {rows_deleted} rows from {qualified_table_name}")
         
         # Auto-commit if requested
         if auto_commit:
             connection.commit()
-            print(f"✅ Changes committed for {table_spec}")
+            print(f"✅ Changes committed for {qualified_table_name}")
         
         cursor.close()
         return rows_deleted
         
     except oracledb.Error as e:
-        print(f"❌ Error deleting from {table_spec}: {e}")
+        print(f"❌ Error deleting from {qualified_table_name}: {e}")
         cursor.close()
         raise
 
 
-def process_table_deletion(connection: oracledb.Connection, table_spec: str, 
+def process_table_deletion(connection: oracledb.Connection, table: TableSpec, 
                           dry_run: bool = False, auto_confirm: bool = False, 
                           auto_commit: bool = False) -> int:
     """Process deletion for a single table"""
-    try:
-        owner, table_name = parse_table_name(table_spec)
-    except ValueError as e:
-        print(f"Error: {e}")
-        raise
-    
-    qualified_table_name = f"{owner}.{table_name}"
+    owner, table_name, qualified_table_name = table
     
     # Get column information
     columns = get_table_columns(connection, owner, table_name)
@@ -424,7 +613,7 @@ def process_table_deletion(connection: oracledb.Connection, table_spec: str,
     where_clause, bind_params = build_where_clause(pk_values, pk_columns)
     
     # Preview data to be deleted
-    row_count = preview_data_to_delete(connection, table_spec, where_clause, bind_params)
+    row_count = preview_data_to_delete(connection, table, where_clause, bind_params)
     
     if row_count == 0:
         print(f"⚠️  No data to delete from {qualified_table_name}")
@@ -437,84 +626,132 @@ def process_table_deletion(connection: oracledb.Connection, table_spec: str,
             return 0
     
     # Execute deletion
-    return execute_deletion(connection, table_spec, where_clause, bind_params, dry_run, auto_commit)
+    return execute_deletion(connection, table, where_clause, bind_params, dry_run, auto_commit)
+
+
+def _quote(value: Any) -> str:
+    """Render a bind value as a SQL literal"""
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    return str(value)
 
 
-def write_delete_statements_to_file(connection: oracledb.Connection, tables: List[str], 
+def _bind_declarations(pk_columns: List[Dict[str, Any]], bind_params: Dict[str, Any]) -> List[str]:
+    """Build SQL*Plus VARIABLE/EXEC lines that set the bind variables of a DELETE statement
+
+    The statement itself keeps its :NAME placeholders, so it is parsed once per
+    table when the file is run and never has values spliced into its text.
+    """
+    lines = []
+    for col in pk_columns:
+        col_name = col['name']
+        if col_name not in bind_params:
+            continue
+        value = bind_params[col_name]
+        if col['data_type'] == 'NUMBER':
+            var_type = 'NUMBER'
+        elif col['data_type'] == 'CHAR':
+            # CHAR binds keep blank-padded comparison semantics
+            var_type = f"CHAR({col['data_length']})"
+        else:
+            # Dates are bound as YYYY-MM-DD strings and converted with TO_DATE
+            var_type = 'VARCHAR2(4000)'
+        lines.append(f"VARIABLE {col_name} {var_type}\n")
+        lines.append(f"EXEC :{col_name} := {_quote(value)};\n")
+    return lines
+
+
+def write_delete_statements_to_file(connection: oracledb.Connection, tables: List[TableSpec], 
                                    output_file: str) -> None:
     """Generate DELETE statements and write to file"""
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
     
-    with open(output_file, 'w') as file:
-        file.write(f"-- Oracle DELETE statements\n")
-        file.write(f"-- Generated on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        file.write("-- WARNING: These statements will permanently delete data!\n")
-        file.write("-- Review carefully before execution\n\n")
-        file.write("SET DEFINE OFF;\n\n")
+    now_str = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    
+    with open(output_file, 'w', buffering=1 << 16) as file:
+        file.write(
+            "-- Oracle DELETE statements\n"
+            f"-- Generated on {now_str}\n"
+            "-- WARNING: These statements will permanently delete data!\n"
+            "-- Review carefully before execution\n"
+            "-- Filter values are set with SQL*Plus VARIABLE/EXEC (SQL*Plus, SQLcl or SQL Developer)\n\n"
+            "SET DEFINE OFF;\n\n"
+        )
         
         total_statements = 0
         
-        for table in tables:
+        # The shared metadata cursor is released even if a table fails or the user aborts
+        try:
+            # Fetch column metadata for every table up front: one query per owner, after a
+            # lookup of the SYS.ODCIVARCHAR2LIST collection type the table names are bound as
             try:
-                print(f"\n🔄 Processing {table} for DELETE statement generation...")
-                
-                # Get deletion configuration from user
-                try:
-                    owner, table_name = parse_table_name(table)
-                except ValueError as e:
-                    print(f"Error: {e}")
-                    continue
-                
-                qualified_table_name = f"{owner}.{table_name}"
-                columns = get_table_columns(connection, owner, table_name)
-                
-                if not columns:
-                    print(f"⚠️  Table {qualified_table_name} not found or no access")
-                    continue
-                
-                pk_columns = [col for col in columns if col['is_pk']]
-                if not pk_columns:
-                    pk_columns = columns[:5]
-                
-                pk_values = prompt_for_pk_values(pk_columns, qualified_table_name)
-                where_clause, bind_params = build_where_clause(pk_values, pk_columns)
-                
-                # Generate DELETE statement
-                delete_stmt = generate_delete_statement(table, where_clause)
-                
-                # Write to file
-                file.write(f"-- DELETE statement for {qualified_table_name}\n")
-                file.write(f"-- Generated on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                if bind_params:
-                    file.write(f"-- Note: This statement uses bind parameters that need to be substituted\n")
-                    for param, value in bind_params.items():
-                        if isinstance(value, str):
-                            delete_stmt = delete_stmt.replace(f":{param}", f"'{value}'")
-                        else:
-                            delete_stmt = delete_stmt.replace(f":{param}", str(value))
-                
-                file.write(f"{delete_stmt};\n\n")
-                total_statements += 1
-                
+                columns_by_table = get_all_table_columns(connection, [(owner, table_name) for owner, table_name, _ in tables])
             except Exception as e:
-                print(f"❌ Error processing {table}: {e}")
-                file.write(f"-- ERROR processing {table}: {e}\n\n")
+                # Look the tables up one at a time instead, so a failure is reported per table
+                print(f"⚠️  Could not fetch column metadata for all tables at once: {e}")
+                columns_by_table = None
+            
+            for table in tables:
+                owner, table_name, qualified_table_name = table
+                try:
+                    print(f"\n🔄 Processing {qualified_table_name} for DELETE statement generation...")
+                    
+                    # Get deletion configuration from user
+                    if columns_by_table is None:
+                        columns = get_table_columns(connection, owner, table_name)
+                    else:
+                        columns = columns_by_table.get((owner, table_name), [])
+                    
+                    if not columns:
+                        print(f"⚠️  Table {qualified_table_name} not found or no access")
+                        continue
+                    
+                    pk_columns = [col for col in columns if col['is_pk']]
+                    if not pk_columns:
+                        pk_columns = columns[:5]
+                    
+                    pk_values = prompt_for_pk_values(pk_columns, qualified_table_name)
+                    where_clause, bind_params = build_where_clause(pk_values, pk_columns)
+                    
+                    # Generate DELETE statement
+                    delete_stmt = generate_delete_statement(table, where_clause)
+                    
+                    # Write the whole block for this table at once
+                    block = [
+                        f"-- DELETE statement for {qualified_table_name}\n",
+                        f"-- Generated on {now_str}\n",
+                    ]
+                    if bind_params:
+                        block.extend(_bind_declarations(pk_columns, bind_params))
+                    block.append(f"{delete_stmt};\n\n")
+                    
+                    file.write(''.join(block))
+                    total_statements += 1
+                    
+                except Exception as e:
+                    print(f"❌ Error processing {qualified_table_name}: {e}")
+                    file.write(f"-- ERROR processing {qualified_table_name}: {e}\n\n")
+        finally:
+            close_metadata_cursor()
         
-        file.write(f"\n-- Total DELETE statements generated: {total_statements}\n")
-        file.write("-- COMMIT; -- Uncomment to commit the deletions\n")
-        file.write("-- ROLLBACK; -- Uncomment to rollback the deletions\n")
+        file.write(
+            f"\n-- Total DELETE statements generated: {total_statements}\n"
+            "-- COMMIT; -- Uncomment to commit the deletions\n"
+            "-- ROLLBACK; -- Uncomment to rollback the deletions\n"
+        )
     
     print(f"\n✅ Successfully generated {total_statements} DELETE statements in {output_file}")
 
 
-def validate_tables(tables: List[str]) -> List[str]:
+def validate_tables(tables: List[str]) -> List[TableSpec]:
     """Validate that all tables are in OWNER.TABLE format
 
     Args:
         tables: List of table names to validate
 
     Returns:
-        List of validated table names
+        List of (owner, table_name, qualified_table_name) tuples, parsed once
+        here and passed as-is to the rest of the script
 
     Raises:
         ValueError: If any table name is invalid
@@ -528,21 +765,19 @@ def validate_tables(tables: List[str]) -> List[str]:
             continue  # Skip empty entries
 
         # Validate OWNER.TABLE format
-        if '.' not in table_name:
-            raise ValueError(f"Table #{idx}: Must be in OWNER.TABLE format. Got: {table_name}")
-
-        parts = table_name.split('.', 1)
-        if len(parts) != 2 or not parts[0].strip() or not parts[1].strip():
-            raise ValueError(f"Table #{idx}: Invalid table specification. Expected OWNER.TABLE format. Got: {table_name}")
+        try:
+            owner, table = parse_table_name(table_name)
+        except ValueError as e:
+            raise ValueError(f"Table #{idx}: {e}")
 
-        validated_tables.append(table_name)
+        validated_tables.append((owner, table, f"{owner}.{table}"))
 
     if not validated_tables:
         raise ValueError("No valid table names found in configuration")
 
     print(f"\n📋 Tables to process ({len(validated_tables)}):")
-    for table in validated_tables:
-        print(f"   • {table}")
+    for _, _, qualified_table_name in validated_tables:
+        print(f"   • {qualified_table_name}")
     print()
 
     return validated_tables
@@ -14,23 +14,69 @@ Usage:
 """
 
 import os
+import pickle
+import re
 import oracledb
 import datetime
 import argparse
-import yaml
-from typing import List, Dict, Any, Tuple
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Tuple, Iterable, Iterator, Callable, BinaryIO, Optional
 
+from config_cache import file_signature, load_yaml_with_sidecar
 
-def load_config(config_file: str) -> Dict[str, Any]:
-    """Load configuration from YAML file"""
+# Fetch tuning used when the config file has no 'performance' section.
+# Larger fetch batches mean fewer network round-trips on big tables.
+_DEFAULT_PERFORMANCE = {
+    'arraysize': 10000,
+    'prefetchrows': 10001,
+    'batch_size': 250,
+    'parallelism': 4,
+    'lob_arraysize': 100,
+}
+
+# Column types fetched inline as whole values, see _export_output_type_handler
+_LOB_DATA_TYPES = frozenset(('CLOB', 'NCLOB', 'BLOB'))
+
+# Parallel export batches buffered per table that has LOB columns
+_LOB_EXPORT_QUEUE_SIZE = 2
+
+# Format of the dates entered for primary key filters, matches TO_DATE(..., 'YYYY-MM-DD')
+_DATE_FMT = '%Y-%m-%d'
+
+# The output file is written in binary mode, each statement is encoded once
+_OUTPUT_ENCODING = 'utf-8'
+
+# MERGE statements buffered per table while waiting for the writer in a parallel export
+_EXPORT_QUEUE_SIZE = 64
+
+# Characters per TO_CLOB piece; even 4-byte characters, or a piece made only of
+# quotes (each escaped to two), keep it within the 4000-byte limit of a SQL
+# string literal and well under SQL*Plus's 2499-character line limit
+_CLOB_CHUNK_CHARS = 1000
+
+# Unquoted Oracle identifier, the only table and column names a replay file may name
+_IDENTIFIER_RE = re.compile(r'^[A-Za-z][A-Za-z0-9_$#]*$')
+
+# Largest binary value a HEXTORAW literal can hold (4000 hex digits). Unlike
+# CLOBs, BLOB pieces cannot be joined with || in SQL, so nothing longer fits.
+_RAW_LITERAL_MAX_BYTES = 2000
+
+
+def load_config(config_file: str, require_tables: bool = True) -> Dict[str, Any]:
+    """Load configuration from YAML file
+
+    With require_tables=False (--replay) only the database section is needed.
+    """
     try:
-        with open(config_file, 'r') as file:
-            config = yaml.safe_load(file)
+        s = os.stat(config_file)
+        config = load_yaml_with_sidecar(config_file, s, file_signature(config_file, s))
 
         # Validate required sections
         if 'database' not in config:
             raise ValueError("Config file must contain 'database' section")
-        if 'tables' not in config or not config['tables']:
+        if require_tables and ('tables' not in config or not config['tables']):
             raise ValueError("Config file must contain 'tables' section with at least one table")
 
         # Validate database section
@@ -50,10 +96,17 @@ def load_config(config_file: str) -> Dict[str, Any]:
         if 'shared_values' not in config or config['shared_values'] is None:
             config['shared_values'] = {}
 
+        # Fill in fetch tuning defaults
+        if not config.get('performance'):
+            config['performance'] = {}
+        for key, value in _DEFAULT_PERFORMANCE.items():
+            config['performance'].setdefault(key, value)
+
         print(f"Successfully loaded configuration from {config_file}")
         print(f"  Database: {db_config['dsn']}")
         print(f"  Output file: {config['output']['file']}")
-        print(f"  Tables to export: {len(config['tables'])}")
+        if config.get('tables'):
+            print(f"  Tables to export: {len(config['tables'])}")
         if config['shared_values']:
             print(f"  Shared values configured: {len(config['shared_values'])}")
 
@@ -62,9 +115,6 @@ def load_config(config_file: str) -> Dict[str, Any]:
     except FileNotFoundError:
         print(f"Error: Configuration file '{config_file}' not found")
         raise
-    except yaml.YAMLError as e:
-        print(f"Error parsing YAML file '{config_file}': {e}")
-        raise
     except Exception as e:
         print(f"Error loading configuration: {e}")
         raise
@@ -74,6 +124,8 @@ def connect_to_database(username: str, password: str, dsn: str) -> oracledb.Conn
     """Establish connection to Oracle database"""
     try:
         connection = oracledb.connect(user=username, password=password, dsn=dsn)
+        # Keep repeated metadata/data queries prepared
+        connection.stmtcachesize = 50
         print(f"Successfully connected to Oracle Database {connection.version}")
         return connection
     except oracledb.Error as error:
@@ -81,30 +133,82 @@ def connect_to_database(username: str, password: str, dsn: str) -> oracledb.Conn
         raise
 
 
-def get_table_columns(connection: oracledb.Connection, owner: str, table_name: str) -> List[Dict[str, Any]]:
-    """Get column information including primary key status for a table"""
+def _new_cursor(connection: oracledb.Connection, performance: Dict[str, Any] = None) -> oracledb.Cursor:
+    """Open a cursor using the configured fetch array size and prefetch rows"""
+    performance = performance or _DEFAULT_PERFORMANCE
     cursor = connection.cursor()
+    cursor.arraysize = performance['arraysize']
+    cursor.prefetchrows = performance['prefetchrows']
+    return cursor
+
+
+# LOB types fetched inline by export cursors, with the long type that holds them
+_INLINE_LOB_TYPES = {
+    oracledb.DB_TYPE_CLOB: oracledb.DB_TYPE_LONG,
+    oracledb.DB_TYPE_NCLOB: oracledb.DB_TYPE_LONG_NVARCHAR,
+    oracledb.DB_TYPE_BLOB: oracledb.DB_TYPE_LONG_RAW,
+}
+
+
+def _export_output_type_handler(cursor: oracledb.Cursor, metadata: oracledb.FetchInfo):
+    """Choose fetch types for the columns of an export cursor
+
+    NUMBER columns with scale 0 are fetched as int, str() of an int is a C
+    fast path, unlike Decimal which oracledb would return if
+    oracledb.defaults.fetch_decimals were enabled. CLOB/NCLOB/BLOB values are
+    fetched inline as str/bytes instead of LOB locators, which would otherwise
+    cost an extra round-trip per value. This is set per cursor, so other
+    oracledb users in the process keep the default LOB handling. Other columns
+    keep the default conversion.
+    """
+    if metadata.type_code is oracledb.DB_TYPE_NUMBER and metadata.scale == 0:
+        return cursor.var(int, arraysize=cursor.arraysize)
+    if metadata.type_code in _INLINE_LOB_TYPES:
+        return cursor.var(_INLINE_LOB_TYPES[metadata.type_code], arraysize=cursor.arraysize)
+    return None
+
+
+def create_connection_pool(username: str, password: str, dsn: str,
+                           max_connections: int) -> oracledb.ConnectionPool:
+    """Create a connection pool for exporting tables in parallel"""
+    try:
+        # Same statement cache size as connect_to_database
+        pool = oracledb.create_pool(user=username, password=password, dsn=dsn,
+                                    min=1, max=max_connections, increment=1,
+                                    stmtcachesize=50)
+        print(f"Created connection pool with up to {max_connections} connections")
+        return pool
+    except oracledb.Error as error:
+        print(f"Error creating connection pool: {error}")
+        raise
+
+
+def get_table_columns(connection: oracledb.Connection, owner: str, table_name: str,
+                      performance: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+    """Get column information including primary key status for a table"""
+    cursor = _new_cursor(connection, performance)
     
     query = """
-    SELECT DISTINCT
+    SELECT
         c.column_name, 
         c.data_type,
         c.data_length,
         c.data_precision,
         c.data_scale,
         c.nullable,
-        CASE WHEN EXISTS (
-            SELECT 1 
+        CASE WHEN pk.column_name IS NOT NULL THEN 1 ELSE 0 END AS is_pk,
+        c.column_id
+    FROM 
+        all_tab_columns c
+        LEFT JOIN (
+            SELECT cc.column_name
             FROM all_cons_columns cc
             INNER JOIN all_constraints con ON cc.constraint_name = con.constraint_name
+                                          AND cc.owner = con.owner
             WHERE con.constraint_type = 'P'
               AND cc.table_name = :table_name
               AND cc.owner = :owner
-              AND cc.column_name = c.column_name
-        ) THEN 1 ELSE 0 END AS is_pk,
-        c.column_id
-    FROM 
-        all_tab_columns c
+        ) pk ON pk.column_name = c.column_name
     WHERE 
         c.table_name = :table_name
         AND c.owner = :owner
@@ -273,17 +377,12 @@ def prompt_for_pk_values(pk_columns: List[Dict[str, Any]], shared_values: Dict[s
                         processed_value = int(value)
                     pk_values[col_name] = processed_value
                 elif data_type in ('DATE', 'TIMESTAMP'):
-                    # Validate date format
-                    if len(value) == 10 and value[4] == '-' and value[7] == '-':
-                        # Try to parse the date to validate it
-                        try:
-                            datetime.datetime.strptime(value, '%Y-%m-%d')
-                            pk_values[col_name] = value
-                        except ValueError:
-                            print("Invalid date. Please use format YYYY-MM-DD (e.g., 2024-12-25)")
-                            continue
-                    else:
-                        print("Date format should be YYYY-MM-DD (e.g., 2024-12-25)")
+                    # Validate the date, strptime checks the layout as well
+                    try:
+                        datetime.datetime.strptime(value, _DATE_FMT)
+                        pk_values[col_name] = value
+                    except ValueError:
+                        print("Invalid date. Please use format YYYY-MM-DD (e.g., 2024-12-25)")
                         continue
                 else:
                     # Treat as string for all other data types
@@ -316,31 +415,134 @@ def build_where_clause(pk_values: Dict[str, Any], pk_columns: List[Dict[str, Any
     where_clause = " AND ".join(where_conditions) if where_conditions else ""
     return where_clause, bind_params
 
-def format_value_for_sql(value: Any, data_type: str) -> str:
-    """Format a value based on its data type for inclusion in SQL"""
+def _quote_text(text: str) -> str:
+    """Quote a string as a SQL literal, escaping single quotes"""
+    # Most values contain no quotes, so skip building an escaped copy for them
+    if "'" in text:
+        text = text.replace("'", "''")
+    return "'" + text + "'"
+
+
+def _format_text(value: Any) -> str:
+    """Format a character value, escaping single quotes"""
     if value is None:
         return 'NULL'
-    
-    # Handle different Oracle data types
-    if data_type in ('VARCHAR2', 'CHAR', 'NVARCHAR2', 'NCHAR', 'CLOB', 'NCLOB'):
-        # Escape single quotes in the string
-        return f"'{str(value).replace('\'', '\'\'')}'"
+    return _quote_text(value if type(value) is str else str(value))
+
+
+def _format_clob(value: Any) -> str:
+    """Format a CLOB/NCLOB value, splitting long text into concatenated TO_CLOB pieces
+
+    A single SQL string literal is limited to 4000 bytes, so anything longer
+    than _CLOB_CHUNK_CHARS is emitted as TO_CLOB('...') || TO_CLOB('...').
+    A piece stays under the limit even with every quote escaped, and each one
+    goes on its own line. fetch_merge_statements also starts every value on a
+    new line, so no line holding CLOB text exceeds SQL*Plus's 2499-character
+    limit.
+    Short values and NULL are wrapped in TO_CLOB as well, so every row of a
+    batched MERGE source has the same CLOB type (mixing it with VARCHAR2 in a
+    UNION ALL raises ORA-01790).
+    """
+    if value is None:
+        return 'TO_CLOB(NULL)'
+    text = value if type(value) is str else str(value)
+    if len(text) <= _CLOB_CHUNK_CHARS:
+        return f"TO_CLOB({_quote_text(text)})"
+    return "\n|| ".join(
+        f"TO_CLOB({_quote_text(text[i:i + _CLOB_CHUNK_CHARS])})"
+        for i in range(0, len(text), _CLOB_CHUNK_CHARS)
+    )
+
+
+def _format_number(value: Any) -> str:
+    """Format a NUMBER value"""
+    if value is None:
+        return 'NULL'
+    return str(value)
+
+
+def _format_date(value: Any) -> str:
+    """Format a DATE value, handling both datetime objects and string dates"""
+    if value is None:
+        return 'NULL'
+    if isinstance(value, datetime.datetime):
+        # Attribute formatting is much cheaper than strftime for this fixed layout
+        return (f"TO_DATE('{value.year:04d}-{value.month:02d}-{value.day:02d} "
+                f"{value.hour:02d}:{value.minute:02d}:{value.second:02d}', 'YYYY-MM-DD HH24:MI:SS')")
+    return f"TO_DATE('{value}', 'YYYY-MM-DD')"
+
+
+def _format_timestamp(value: Any) -> str:
+    """Format a TIMESTAMP value, handling both datetime objects and string timestamps"""
+    if value is None:
+        return 'NULL'
+    if isinstance(value, datetime.datetime):
+        # Attribute formatting is much cheaper than strftime for this fixed layout
+        return (f"TO_TIMESTAMP('{value.year:04d}-{value.month:02d}-{value.day:02d} "
+                f"{value.hour:02d}:{value.minute:02d}:{value.second:02d}.{value.microsecond:06d}', "
+                f"'YYYY-MM-DD HH24:MI:SS.FF')")
+    return f"TO_TIMESTAMP('{value}', 'YYYY-MM-DD HH24:MI:SS.FF')"
+
+
+def _hex_literal(value: bytes) -> str:
+    """Return binary data as a HEXTORAW literal, refusing values too long for one"""
+    if len(value) > _RAW_LITERAL_MAX_BYTES:
+        raise ValueError(f"Binary value of {len(value)} bytes exceeds the {_RAW_LITERAL_MAX_BYTES} bytes "
+                         f"a SQL literal can hold, use --format parameterized for this table")
+    return f"HEXTORAW('{value.hex().upper()}')"
+
+
+def _format_blob(value: Any) -> str:
+    """Format a BLOB value fetched as bytes
+
+    NULL is typed as well, so every row of a batched MERGE source is a BLOB.
+    """
+    if value is None:
+        return 'TO_BLOB(NULL)'
+    return f"TO_BLOB({_hex_literal(value)})"
+
+
+def _format_raw(value: Any) -> str:
+    """Format a RAW/LONG RAW value fetched as bytes"""
+    if value is None:
+        return 'HEXTORAW(NULL)'
+    return _hex_literal(value)
+
+
+def _format_other(value: Any) -> str:
+    """Default formatting for other data types"""
+    if value is None:
+        return 'NULL'
+    return _quote_text(str(value))
+
+
+def make_formatter(data_type: str) -> Callable[[Any], str]:
+    """Return the function that formats values of an Oracle data type for inclusion in SQL
+
+    The data type is constant per column, so callers resolve the formatter once
+    per column instead of dispatching on the type for every value.
+    """
+    if data_type in ('VARCHAR2', 'CHAR', 'NVARCHAR2', 'NCHAR'):
+        return _format_text
+    elif data_type in ('CLOB', 'NCLOB'):
+        return _format_clob
+    elif data_type == 'BLOB':
+        return _format_blob
+    elif data_type in ('RAW', 'LONG RAW'):
+        return _format_raw
     elif data_type == 'NUMBER':
-        return str(value)
+        return _format_number
     elif data_type == 'DATE':
-        # Handle both datetime objects and string dates
-        if isinstance(value, datetime.datetime):
-            return f"TO_DATE('{value.strftime('%Y-%m-%d %H:%M:%S')}', 'YYYY-MM-DD HH24:MI:SS')"
-        else:
-            return f"TO_DATE('{value}', 'YYYY-MM-DD')"
+        return _format_date
     elif data_type.startswith('TIMESTAMP'):
-        if isinstance(value, datetime.datetime):
-            return f"TO_TIMESTAMP('{value.strftime('%Y-%m-%d %H:%M:%S.%f')}', 'YYYY-MM-DD HH24:MI:SS.FF')"
-        else:
-            return f"TO_TIMESTAMP('{value}', 'YYYY-MM-DD HH24:MI:SS.FF')"
+        return _format_timestamp
     else:
-        # Default handling for other data types
-        return f"'{str(value)}'"
+        return _format_other
+
+
+def format_value_for_sql(value: Any, data_type: str) -> str:
+    """Format a value based on its data type for inclusion in SQL"""
+    return make_formatter(data_type)(value)
 
 
 def parse_table_name(table_spec: str) -> tuple[str, str]:
@@ -356,12 +558,67 @@ def parse_table_name(table_spec: str) -> tuple[str, str]:
     return owner.upper().strip(), table.upper().strip()
 
 
-def generate_merge_statements(connection: oracledb.Connection, table_spec: str,
-                              shared_values: Dict[str, Any] = None,
-                              processed_tables: set = None) -> List[str]:
-    """Generate MERGE statements for a table with user-specified PK values"""
+def find_oversized_binary_columns(connection: oracledb.Connection, qualified_table_name: str,
+                                  columns: List[Dict[str, Any]], where_clause: str,
+                                  bind_params: Dict[str, Any]) -> List[str]:
+    """Return the BLOB/RAW columns holding a value too long for a HEXTORAW literal
+
+    Only the rows selected by where_clause are measured, with a single
+    query that reads LOB lengths rather than their contents. LONG RAW
+    values cannot be measured in SQL, they are still checked as they are
+    formatted.
+    """
+    lengths = []
+    for col in columns:
+        if col['data_type'] == 'BLOB':
+            lengths.append((col['name'], f"MAX(DBMS_LOB.GETLENGTH({col['name']}))"))
+        elif col['data_type'] == 'RAW' and (col['data_length'] or 0) > _RAW_LITERAL_MAX_BYTES:
+            # Only RAW columns declared wider than a literal (extended data types) can overflow it
+            lengths.append((col['name'], f"MAX(UTL_RAW.LENGTH({col['name']}))"))
+    if not lengths:
+        return []
+
+    query = f"SELECT /*+ NO_PARALLEL */ {', '.join(expr for _, expr in lengths)} FROM {qualified_table_name}"
+    if where_clause:
+        query += f" WHERE {where_clause}"
+
+    cursor = connection.cursor()
+    try:
+        if bind_params:
+            cursor.execute(query, bind_params)
+        else:
+            cursor.execute(query)
+        row = cursor.fetchone()
+    finally:
+        cursor.close()
+
+    return [name for (name, _), length in zip(lengths, row)
+            if length is not None and length > _RAW_LITERAL_MAX_BYTES]
+
+
+def prepare_table_export(connection: oracledb.Connection, table_spec: str,
+                         shared_values: Dict[str, Any] = None,
+                         processed_tables: set = None,
+                         performance: Dict[str, Any] = None,
+                         verbose: bool = False,
+                         columns_cache: Dict[Tuple[str, str], List[Dict[str, Any]]] = None,
+                         output_format: str = 'sql'
+                         ) -> Optional[Dict[str, Any]]:
+    """Collect everything needed to export a table, prompting the user for PK filters
+
+    For the 'sql' output_format a table with binary values too long for a
+    SQL literal is skipped and reported here, before any of it is written.
+
+    Returns:
+        Export plan for fetch_merge_statements, or None if the user cancelled
+        the export of this table or it cannot be exported in output_format
+    """
     shared_values = shared_values or {}
-    processed_tables = processed_tables or set()
+    # Compare against None, an empty set from the caller must be kept so additions are seen
+    if processed_tables is None:
+        processed_tables = set()
+    if columns_cache is None:
+        columns_cache = {}
     # Parse table specification (must include owner)
     try:
         owner, table_name = parse_table_name(table_spec)
@@ -371,15 +628,19 @@ def generate_merge_statements(connection: oracledb.Connection, table_spec: str,
     
     qualified_table_name = f"{owner}.{table_name}"
     
-    # Get column information
-    columns = get_table_columns(connection, owner, table_name)
+    # Get column information, reusing it when the table appears more than once
+    if (owner, table_name) not in columns_cache:
+        columns_cache[(owner, table_name)] = get_table_columns(connection, owner, table_name, performance)
+    columns = columns_cache[(owner, table_name)]
     
     if not columns:
         raise ValueError(f"Table {qualified_table_name} not found or no access")
     
-    # Identify primary key columns and non-primary key columns
-    pk_columns = [col for col in columns if col['is_pk']]
-    non_pk_columns = [col for col in columns if not col['is_pk']]
+    # Identify primary key columns and non-primary key columns in a single pass
+    pk_columns = []
+    non_pk_columns = []
+    for col in columns:
+        (pk_columns if col['is_pk'] else non_pk_columns).append(col)
     
     # If no primary keys defined, use all columns as matching criteria
     if not pk_columns:
@@ -414,18 +675,29 @@ def generate_merge_statements(connection: oracledb.Connection, table_spec: str,
     if temp_pk_values:
         temp_where_clause, temp_bind_params = build_where_clause(temp_pk_values, pk_columns)
 
-    # Get initial row count to determine if we need to prompt
+    # Check whether any rows match to determine if we need to prompt. Only an
+    # existence check is needed, the exact count is only fetched in verbose mode.
     cursor = connection.cursor()
-    count_query = f"SELECT /*+ NO_PARALLEL */ COUNT(*) FROM {qualified_table_name}"
-    if temp_where_clause:
-        count_query += f" WHERE {temp_where_clause}"
+    if verbose:
+        count_query = f"SELECT /*+ NO_PARALLEL */ COUNT(*) FROM {qualified_table_name}"
+        if temp_where_clause:
+            count_query += f" WHERE {temp_where_clause}"
+    else:
+        count_query = f"SELECT /*+ NO_PARALLEL FIRST_ROWS(1) */ 1 FROM {qualified_table_name} WHERE "
+        if temp_where_clause:
+            count_query += f"{temp_where_clause} AND "
+        count_query += "ROWNUM = 1"
 
     try:
         if temp_bind_params:
             cursor.execute(count_query, temp_bind_params)
         else:
             cursor.execute(count_query)
-        initial_row_count = cursor.fetchone()[0]
+        row = cursor.fetchone()
+        if verbose:
+            initial_row_count = row[0]
+        else:
+            initial_row_count = 1 if row else 0
     except oracledb.DatabaseError as e:
         # Handle ORA-01722 (invalid number) and other database errors
         error_obj, = e.args
@@ -439,7 +711,12 @@ def generate_merge_statements(connection: oracledb.Connection, table_spec: str,
     # Prompt for primary key values
     print(f"\nTable: {qualified_table_name}")
     if temp_pk_values:
-        print(f"Found {initial_row_count} rows with shared column values.")
+        if verbose:
+            print(f"Found {initial_row_count} rows with shared column values.")
+        elif initial_row_count:
+            print("Found matching rows with shared column values.")
+        else:
+            print("Found 0 rows with shared column values.")
     print("Enter primary key values to filter rows for export.")
     pk_values = prompt_for_pk_values(pk_columns, shared_values, qualified_table_name,
                                    processed_tables, initial_row_count)
@@ -452,11 +729,40 @@ def generate_merge_statements(connection: oracledb.Connection, table_spec: str,
         response = input(f"\nWarning: No filters specified. This will export ALL rows from {qualified_table_name}. Continue? (y/N): ")
         if response.lower() not in ('y', 'yes'):
             print("Export cancelled.")
-            return []
+            return None
     
     # Build WHERE clause for filtering rows
     where_clause, bind_params = build_where_clause(pk_values, pk_columns)
     
+    if output_format == 'sql':
+        oversized = find_oversized_binary_columns(connection, qualified_table_name, columns,
+                                                  where_clause, bind_params)
+        if oversized:
+            print(f"⚠️  Skipping {qualified_table_name}: {', '.join(oversized)} hold values over "
+                  f"{_RAW_LITERAL_MAX_BYTES} bytes, more than a SQL literal can hold. "
+                  f"Export this table with --format parameterized.")
+            return None
+    
+    return {
+        'qualified_table_name': qualified_table_name,
+        'columns': columns,
+        'pk_columns': pk_columns,
+        'non_pk_columns': non_pk_columns,
+        'where_clause': where_clause,
+        'bind_params': bind_params,
+    }
+
+
+def _merge_template(export_plan: Dict[str, Any]) -> Tuple[str, str]:
+    """Return the parts of a table's MERGE statement before and after the source values
+
+    The suffix has no terminating semicolon.
+    """
+    qualified_table_name = export_plan['qualified_table_name']
+    columns = export_plan['columns']
+    pk_columns = export_plan['pk_columns']
+    non_pk_columns = export_plan['non_pk_columns']
+    
     # Build ON clause for the MERGE statement
     on_clause = " AND ".join([f"target.{col['name']} = source.{col['name']}" for col in pk_columns])
     
@@ -469,8 +775,37 @@ def generate_merge_statements(connection: oracledb.Connection, table_spec: str,
     # Column names for INSERT clause
     all_column_names = [col['name'] for col in columns]
     
+    insert_cols = ", ".join(all_column_names)
+    insert_vals = ", ".join(f"source.{col_name}" for col_name in all_column_names)
+    merge_prefix = f"MERGE INTO {qualified_table_name} target\nUSING (SELECT \n"
+    merge_suffix = f"\nFROM dual) source\nON ({on_clause})\n"
+    if update_clause:
+        merge_suffix += f"{update_clause}\n"
+    merge_suffix += f"WHEN NOT MATCHED THEN INSERT (\n{insert_cols}\n) VALUES (\n{insert_vals}\n)"
+    return merge_prefix, merge_suffix
+
+
+def _has_lob_columns(export_plan: Dict[str, Any]) -> bool:
+    """Return whether a table export fetches CLOB/NCLOB/BLOB values"""
+    return any(col['data_type'] in _LOB_DATA_TYPES for col in export_plan['columns'])
+
+
+def _execute_export_query(connection: oracledb.Connection, export_plan: Dict[str, Any],
+                          performance: Dict[str, Any] = None) -> oracledb.Cursor:
+    """Run the SELECT of a prepared table export and return its open cursor"""
+    qualified_table_name = export_plan['qualified_table_name']
+    where_clause = export_plan['where_clause']
+    bind_params = export_plan['bind_params']
+    performance = performance or _DEFAULT_PERFORMANCE
+    
     # Create cursor for data extraction
-    cursor = connection.cursor()
+    cursor = _new_cursor(connection, performance)
+    cursor.outputtypehandler = _export_output_type_handler
+    # LOB values are fetched whole, so each round-trip buffers arraysize complete
+    # values. Fetch far fewer rows at a time for such tables to bound memory.
+    if _has_lob_columns(export_plan):
+        cursor.arraysize = min(cursor.arraysize, performance['lob_arraysize'])
+        cursor.prefetchrows = min(cursor.prefetchrows, cursor.arraysize + 1)
     
     # Construct the query with WHERE clause - use qualified table name
     query = f"SELECT /*+ NO_PARALLEL */ * FROM {qualified_table_name}"
@@ -487,94 +822,506 @@ def generate_merge_statements(connection: oracledb.Connection, table_spec: str,
     else:
         cursor.execute(query)
     
-    rows = cursor.fetchall()
-    total_rows = len(rows)
-    
-    if where_clause:
+    return cursor
+
+
+def _print_rows_retrieved(export_plan: Dict[str, Any], total_rows: int) -> None:
+    """Report how many rows a table export fetched"""
+    if export_plan['where_clause']:
         print(f"Retrieved {total_rows} rows matching the specified primary key values")
     else:
         print(f"Retrieved ALL {total_rows} rows from the table")
+
+
+def fetch_merge_statements(connection: oracledb.Connection, export_plan: Dict[str, Any],
+                           performance: Dict[str, Any] = None) -> Iterator[Tuple[str, int]]:
+    """Fetch the rows of a prepared table export and generate their MERGE statements
+
+    This is a generator: statements are yielded as rows are fetched so the
+    caller can write them out without holding the whole table in memory.
+    Each item is a (statement, row_count) pair, one statement covers up to
+    performance['batch_size'] rows. No user interaction happens here, so it
+    can run on a worker thread.
+    """
+    columns = export_plan['columns']
+    all_column_names = [col['name'] for col in columns]
+    cursor = _execute_export_query(connection, export_plan, performance)
     
-    # Dictionary to map column names to positions
-    column_index = {col['name']: idx for idx, col in enumerate(columns)}
-    
-    # List to store all MERGE statements
-    merge_statements = []
-    
-    # Process rows
-    for row in rows:
-        # Start building the MERGE statement - use qualified table name
-        merge_stmt = [f"MERGE INTO {qualified_table_name} target"]
-        merge_stmt.append("USING (SELECT ")
-        
-        # Add column values
-        values = []
-        for col in columns:
-            col_name = col['name']
-            col_idx = column_index[col_name]
-            value = row[col_idx]
-            formatted_value = format_value_for_sql(value, col['data_type'])
-            values.append(f"{formatted_value} AS {col_name}")
-        
-        merge_stmt.append(", ".join(values))
-        merge_stmt.append("FROM dual) source")
-        
-        # Add ON clause
-        merge_stmt.append(f"ON ({on_clause})")
-        
-        # Add UPDATE clause if applicable
-        if update_clause:
-            merge_stmt.append(update_clause)
-        
-        # Add INSERT clause
-        merge_stmt.append("WHEN NOT MATCHED THEN INSERT (")
-        merge_stmt.append(", ".join(all_column_names))
-        merge_stmt.append(") VALUES (")
-        merge_stmt.append(", ".join([f"source.{col_name}" for col_name in all_column_names]))
-        merge_stmt.append(");")
-        
-        # Add the complete statement to our list
-        merge_statements.append("\n".join(merge_stmt))
+    # Resolve the value formatter of every column once for the whole table
+    formatters = [make_formatter(col['data_type']) for col in columns]
+    
+    # Everything except the source values is the same for every row, so the
+    # MERGE statement is assembled once around a slot for the values.
+    # Up to batch_size rows share one MERGE through a UNION ALL of dual selects,
+    # so the generated script needs far fewer statements to parse on replay.
+    batch_size = max(1, int((performance or _DEFAULT_PERFORMANCE)['batch_size']))
+    row_separator = "\nFROM dual UNION ALL\nSELECT "
+    merge_prefix, merge_suffix = _merge_template(export_plan)
+    merge_suffix += ";"
+    
+    # Fetch exactly one MERGE worth of rows at a time. Network round-trips are
+    # still governed by cursor.arraysize, fetchmany only slices its buffer, and
+    # memory stays bounded by one batch rather than the whole result.
+    # The " AS column" suffixes and the per-row values list are built once, each
+    # row only fills in the slots of the list.
+    as_names = [f" AS {col_name}" for col_name in all_column_names]
+    col_range = range(len(columns))
+    values = [None] * len(columns)
+    total_rows = 0
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        total_rows += len(rows)
+        batch = []
+        for row in rows:
+            # Add column values (SELECT * returns them in column_id order, same as columns)
+            for i in col_range:
+                values[i] = formatters[i](row[i]) + as_names[i]
+            # One value per line, so no line exceeds SQL*Plus's 2499-character limit
+            # just because a row has several long values (see _CLOB_CHUNK_CHARS)
+            batch.append(",\n".join(values))
+        # Hand each statement to the caller with the number of rows it covers
+        yield merge_prefix + row_separator.join(batch) + merge_suffix, len(rows)
     
     cursor.close()
-    return merge_statements
+    
+    _print_rows_retrieved(export_plan, total_rows)
+
 
+def parameterized_merge_statement(export_plan: Dict[str, Any]) -> str:
+    """Return the MERGE statement for one row bound as :1..:n in column order"""
+    merge_prefix, merge_suffix = _merge_template(export_plan)
+    binds = ", ".join(f":{i} AS {col['name']}" for i, col in enumerate(export_plan['columns'], 1))
+    return merge_prefix + binds + merge_suffix
 
-def write_merge_statements_to_file(merge_statements: List[str], table_name: str, 
-                                  output_file: str) -> None:
-    """Append table MERGE statements to a file"""
-    # Ensure parent directory exists
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+
+def fetch_row_batches(connection: oracledb.Connection, export_plan: Dict[str, Any],
+                      performance: Dict[str, Any] = None) -> Iterator[Tuple[List[tuple], int]]:
+    """Fetch the rows of a prepared table export as they are, for a parameterized export
+
+    Yields (rows, row_count) pairs of up to performance['arraysize'] rows, each
+    batch becomes one executemany call on replay.
+    """
+    cursor = _execute_export_query(connection, export_plan, performance)
+    arraysize = cursor.arraysize
     
-    with open(output_file, 'a') as file:
-        # Write table header
-        file.write(f"\n-- MERGE statements for {table_name}\n")
-        file.write(f"-- Generated on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-        
-        # Write all MERGE statements
-        for stmt in merge_statements:
-            file.write(f"{stmt}\n\n")
-        
-        file.write(f"-- {len(merge_statements)} rows exported for {table_name}\n\n")
+    total_rows = 0
+    while True:
+        rows = cursor.fetchmany(arraysize)
+        if not rows:
+            break
+        total_rows += len(rows)
+        yield rows, len(rows)
+    
+    cursor.close()
     
-    print(f"Successfully wrote {len(merge_statements)} MERGE statements for {table_name} to {output_file}")
+    _print_rows_retrieved(export_plan, total_rows)
+
+
+def generate_merge_statements(connection: oracledb.Connection, table_spec: str,
+                              shared_values: Dict[str, Any] = None,
+                              processed_tables: set = None,
+                              performance: Dict[str, Any] = None,
+                              verbose: bool = False,
+                              columns_cache: Dict[Tuple[str, str], List[Dict[str, Any]]] = None
+                              ) -> Iterator[Tuple[str, int]]:
+    """Generate MERGE statements for a table with user-specified PK values
+
+    Prompts for the filters (prepare_table_export) and then streams the
+    statements (fetch_merge_statements) on the same connection.
+    """
+    export_plan = prepare_table_export(connection, table_spec, shared_values, processed_tables,
+                                       performance, verbose, columns_cache)
+    if export_plan is None:
+        return
+    yield from fetch_merge_statements(connection, export_plan, performance)
+
+
+def write_merge_statements_to_file(merge_statements: Iterable[Tuple[str, int]], table_name: str, 
+                                  file: BinaryIO) -> None:
+    """Append table MERGE statements to an output file opened in binary mode
+
+    Statements are written as they are produced, so merge_statements may be
+    a generator such as the one returned by generate_merge_statements, which
+    yields (statement, row_count) pairs.
+    """
+    # Write table header
+    file.write(f"\n-- MERGE statements for {table_name}\n"
+               f"-- Generated on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+               .encode(_OUTPUT_ENCODING))
+    
+    # Stream MERGE statements straight to the file
+    statement_count = 0
+    row_count = 0
+    for stmt, stmt_rows in merge_statements:
+        file.write(stmt.encode(_OUTPUT_ENCODING))
+        file.write(b"\n\n")
+        statement_count += 1
+        row_count += stmt_rows
+    
+    file.write(f"-- {row_count} rows exported for {table_name}\n\n".encode(_OUTPUT_ENCODING))
+    
+    print(f"Successfully wrote {statement_count} MERGE statements ({row_count} rows) for {table_name} to {file.name}")
 
 
 def export_table_as_merge(connection: oracledb.Connection, table_spec: str,
-                         output_file: str, shared_values: Dict[str, Any] = None,
-                         processed_tables: set = None) -> None:
+                         file: BinaryIO, shared_values: Dict[str, Any] = None,
+                         processed_tables: set = None,
+                         performance: Dict[str, Any] = None,
+                         verbose: bool = False,
+                         columns_cache: Dict[Tuple[str, str], List[Dict[str, Any]]] = None) -> None:
     """Export a table as MERGE statements"""
     shared_values = shared_values or {}
-    processed_tables = processed_tables or set()
     try:
         print(f"\nExporting {table_spec}...")
-        merge_statements = generate_merge_statements(connection, table_spec, shared_values, processed_tables)
-        write_merge_statements_to_file(merge_statements, table_spec, output_file)
+        merge_statements = generate_merge_statements(connection, table_spec, shared_values, processed_tables,
+                                                     performance, verbose, columns_cache)
+        write_merge_statements_to_file(merge_statements, table_spec, file)
     except Exception as e:
         print(f"Error exporting {table_spec}: {e}")
         raise
 
 
+def _write_record(file: BinaryIO, record: tuple) -> None:
+    """Append one record to a parameterized export file"""
+    pickle.dump(record, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def write_parameterized_rows_to_file(row_batches: Iterable[Tuple[List[tuple], int]], table_name: str,
+                                     export_plan: Dict[str, Any], file: BinaryIO) -> None:
+    """Append a table to a parameterized export file
+
+    The file is a stream of pickled records. A table is written as
+    ('table', name, qualified_table_name, [(column, data_type), ...], pk_column_names),
+    one ('rows', rows) per batch of row_batches and ('end', name, row_count).
+    No SQL is stored, the replay builds the MERGE from these names.
+    """
+    columns = [(col['name'], col['data_type']) for col in export_plan['columns']]
+    pk_names = [col['name'] for col in export_plan['pk_columns']]
+    _write_record(file, ('table', table_name, export_plan['qualified_table_name'], columns, pk_names))
+    
+    batch_count = 0
+    row_count = 0
+    for rows, batch_rows in row_batches:
+        _write_record(file, ('rows', rows))
+        batch_count += 1
+        row_count += batch_rows
+    
+    _write_record(file, ('end', table_name, row_count))
+    
+    print(f"Successfully wrote {row_count} rows in {batch_count} batches for {table_name} to {file.name}")
+
+
+def export_table_parameterized(connection: oracledb.Connection, table_spec: str,
+                               file: BinaryIO, shared_values: Dict[str, Any] = None,
+                               processed_tables: set = None,
+                               performance: Dict[str, Any] = None,
+                               verbose: bool = False,
+                               columns_cache: Dict[Tuple[str, str], List[Dict[str, Any]]] = None) -> None:
+    """Export a table as a parameterized MERGE and its rows"""
+    try:
+        print(f"\nExporting {table_spec}...")
+        export_plan = prepare_table_export(connection, table_spec, shared_values, processed_tables,
+                                           performance, verbose, columns_cache, 'parameterized')
+        if export_plan is None:
+            return
+        write_parameterized_rows_to_file(fetch_row_batches(connection, export_plan, performance),
+                                         table_spec, export_plan, file)
+    except Exception as e:
+        print(f"Error exporting {table_spec}: {e}")
+        raise
+
+
+def _replay_input_size(data_type: str) -> Any:
+    """Return the bind type to force for a column on replay
+
+    None keeps the type oracledb infers from the value, which is fine except
+    for LOBs, and for TIMESTAMP where a datetime would be bound as DATE and
+    lose its fractional seconds and time zone.
+    """
+    if data_type == 'CLOB':
+        return oracledb.DB_TYPE_CLOB
+    elif data_type == 'NCLOB':
+        return oracledb.DB_TYPE_NCLOB
+    elif data_type == 'BLOB':
+        return oracledb.DB_TYPE_BLOB
+    elif data_type.startswith('TIMESTAMP'):
+        if data_type.endswith('WITH LOCAL TIME ZONE'):
+            return oracledb.DB_TYPE_TIMESTAMP_LTZ
+        elif data_type.endswith('WITH TIME ZONE'):
+            return oracledb.DB_TYPE_TIMESTAMP_TZ
+        return oracledb.DB_TYPE_TIMESTAMP
+    else:
+        return None
+
+
+class _ReplayUnpickler(pickle.Unpickler):
+    """Unpickler that only rebuilds the value types a fetch can return
+
+    Records are made of tuples, lists, dicts, str, bytes, numbers and None,
+    which need no class lookup. Every other global is refused, so a crafted
+    file cannot run code when it is replayed.
+    """
+
+    _ALLOWED = frozenset((
+        ('datetime', 'datetime'),
+        ('datetime', 'date'),
+        ('datetime', 'timedelta'),
+        ('datetime', 'timezone'),
+        ('decimal', 'Decimal'),
+    ))
+
+    def find_class(self, module: str, name: str) -> Any:
+        if (module, name) not in self._ALLOWED:
+            raise pickle.UnpicklingError(f"{module}.{name} is not allowed in a parameterized export file")
+        return super().find_class(module, name)
+
+
+def _read_records(file: BinaryIO) -> Iterator[tuple]:
+    """Yield the records of a parameterized export file
+
+    Stops quietly at the end of the file or at a truncated last record, the
+    caller detects an incomplete file by the missing 'commit' record.
+    """
+    while True:
+        try:
+            # One unpickler per record, every record is dumped with its own memo
+            record = _ReplayUnpickler(file).load()
+        except EOFError:
+            return
+        except pickle.UnpicklingError as e:
+            if 'truncated' not in str(e):
+                raise
+            return
+        if not isinstance(record, tuple) or not record:
+            raise ValueError(f"Unexpected record in parameterized export file: {record!r:.80}")
+        yield record
+
+
+def _replay_export_plan(qualified_table_name: Any, columns: Any, pk_names: Any) -> Dict[str, Any]:
+    """Rebuild the export plan of a 'table' record read from a parameterized export file
+
+    Every name must be a plain identifier, so the MERGE built from the plan
+    cannot carry anything but a MERGE into that table.
+
+    Raises:
+        ValueError: If the record does not describe a table
+    """
+    if not isinstance(qualified_table_name, str) or qualified_table_name.count('.') != 1:
+        raise ValueError(f"invalid table name {qualified_table_name!r:.80}")
+    if not all(_IDENTIFIER_RE.match(part) for part in qualified_table_name.split('.')):
+        raise ValueError(f"invalid table name {qualified_table_name!r:.80}")
+    if not isinstance(columns, list) or not columns:
+        raise ValueError(f"no columns for {qualified_table_name}")
+    for column in columns:
+        if (not isinstance(column, tuple) or len(column) != 2
+                or not isinstance(column[0], str) or not _IDENTIFIER_RE.match(column[0])
+                or not isinstance(column[1], str)):
+            raise ValueError(f"invalid column {column!r:.80} for {qualified_table_name}")
+    column_names = {name for name, _ in columns}
+    if not isinstance(pk_names, list) or not pk_names or not set(pk_names) <= column_names:
+        raise ValueError(f"invalid primary key columns {pk_names!r:.80} for {qualified_table_name}")
+
+    pk_names = set(pk_names)
+    plan_columns = [{'name': name, 'data_type': data_type} for name, data_type in columns]
+    return {
+        'qualified_table_name': qualified_table_name,
+        'columns': plan_columns,
+        'pk_columns': [col for col in plan_columns if col['name'] in pk_names],
+        'non_pk_columns': [col for col in plan_columns if col['name'] not in pk_names],
+    }
+
+
+def replay_parameterized_export(connection: oracledb.Connection, values_file: str) -> int:
+    """Apply a parameterized export file to the connected database
+
+    Every stored batch of rows is sent with one executemany call, so each
+    table's MERGE is parsed once however many rows it has. The MERGE is
+    rebuilt from the table and column names in the file, never read from it.
+    Changes are only committed when the file is complete, anything else rolls
+    them back.
+
+    Returns:
+        Number of rows applied
+    """
+    total_rows = 0
+    committed = False
+    table_name = None
+    cursor = connection.cursor()
+
+    try:
+        with open(values_file, 'rb', buffering=1 << 20) as file:
+            for record in _read_records(file):
+                kind = record[0]
+                # Expected order: an optional 'export', then 'table', 'rows'... 'end' per table, then 'commit'
+                if committed:
+                    raise ValueError(f"{values_file}: '{kind}' record after the final commit")
+                if kind in ('rows', 'end') and table_name is None:
+                    raise ValueError(f"{values_file}: '{kind}' record outside of a table")
+                if kind in ('export', 'table', 'commit') and table_name is not None:
+                    raise ValueError(f"{values_file}: '{kind}' record before the end of {table_name}")
+
+                if kind == 'export':
+                    print(f"Export generated on {record[1]['generated']} from {record[1]['config']}")
+                elif kind == 'table':
+                    try:
+                        _, table_name, qualified_table_name, columns, pk_names = record
+                        export_plan = _replay_export_plan(qualified_table_name, columns, pk_names)
+                    except ValueError as e:
+                        raise ValueError(f"{values_file}: {e}") from None
+                    merge_sql = parameterized_merge_statement(export_plan)
+                    input_sizes = [_replay_input_size(col['data_type']) for col in export_plan['columns']]
+                    table_rows = 0
+                    print(f"\nReplaying {table_name}...")
+                elif kind == 'rows':
+                    if any(input_sizes):
+                        cursor.setinputsizes(*input_sizes)
+                    cursor.executemany(merge_sql, record[1])
+                    table_rows += len(record[1])
+                elif kind == 'end':
+                    total_rows += table_rows
+                    print(f"Applied {table_rows} rows to {table_name}")
+                    table_name = None
+                elif kind == 'commit':
+                    connection.commit()
+                    committed = True
+                else:
+                    raise ValueError(f"{values_file}: unknown record type '{kind}'")
+    finally:
+        cursor.close()
+        if not committed:
+            connection.rollback()
+
+    if not committed:
+        print(f"⚠️  {values_file} is incomplete, changes were rolled back")
+        return 0
+
+    return total_rows
+
+
+def _export_worker(pool: oracledb.ConnectionPool,
+                   fetch: Callable[[oracledb.Connection, Dict[str, Any], Dict[str, Any]], Iterator[tuple]],
+                   export_plan: Dict[str, Any], performance: Dict[str, Any], out_queue: queue.Queue,
+                   abort: threading.Event) -> None:
+    """Stream what fetch produces for one table into out_queue using a pooled connection
+
+    The queue always ends with None. An exception is put in the queue before
+    that so the writer can re-raise it. Stops early once abort is set.
+    """
+    def put(item) -> bool:
+        while not abort.is_set():
+            try:
+                out_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    if abort.is_set():
+        return
+
+    try:
+        connection = pool.acquire()
+        try:
+            for item in fetch(connection, export_plan, performance):
+                if not put(item):
+                    return
+        finally:
+            pool.release(connection)
+    except Exception as e:
+        put(e)
+    finally:
+        put(None)
+
+
+def _drain_queue(out_queue: queue.Queue) -> Iterator[tuple]:
+    """Yield the items an _export_worker puts in its queue, re-raising its errors"""
+    while True:
+        item = out_queue.get()
+        if item is None:
+            return
+        if isinstance(item, Exception):
+            raise item
+        yield item
+
+
+def export_tables_in_parallel(connection: oracledb.Connection, db_config: Dict[str, Any],
+                              tables: List[str], file: BinaryIO,
+                              shared_values: Dict[str, Any] = None,
+                              processed_tables: set = None,
+                              performance: Dict[str, Any] = None,
+                              verbose: bool = False,
+                              columns_cache: Dict[Tuple[str, str], List[Dict[str, Any]]] = None,
+                              output_format: str = 'sql') -> None:
+    """Export several tables as MERGE statements, fetching them concurrently
+
+    All interactive prompts are answered first on the main connection. The
+    tables are then fetched by up to performance['parallelism'] threads, each
+    with its own pooled connection. Output is written by the calling thread in
+    table order, so the file is identical to a sequential export.
+    output_format is 'sql' or 'parameterized', as for the --format option.
+    """
+    parameterized = output_format == 'parameterized'
+    fetch = fetch_row_batches if parameterized else fetch_merge_statements
+    # A parameterized batch holds arraysize rows rather than batch_size, so buffer fewer
+    queue_size = 2 if parameterized else _EXPORT_QUEUE_SIZE
+    performance = performance or _DEFAULT_PERFORMANCE
+    if processed_tables is None:
+        processed_tables = set()
+    if columns_cache is None:
+        columns_cache = {}
+
+    # Pre-pass: gather all user input before any data is fetched
+    export_plans = []
+    for table_spec in tables:
+        try:
+            print(f"\nExporting {table_spec}...")
+            export_plans.append(prepare_table_export(connection, table_spec, shared_values, processed_tables,
+                                                     performance, verbose, columns_cache, output_format))
+        except Exception as e:
+            print(f"Error exporting {table_spec}: {e}")
+            raise
+
+    parallelism = performance['parallelism']
+    pool = create_connection_pool(db_config['username'], db_config['password'], db_config['dsn'],
+                                  parallelism)
+    abort = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=parallelism)
+    try:
+        queues = []
+        for export_plan in export_plans:
+            if export_plan is None:
+                queues.append(None)
+                continue
+            # Bounded so that tables waiting to be written cannot pile up in memory,
+            # even less is buffered for tables whose LOB values are fetched whole
+            table_queue_size = _LOB_EXPORT_QUEUE_SIZE if _has_lob_columns(export_plan) else queue_size
+            out_queue = queue.Queue(maxsize=table_queue_size)
+            executor.submit(_export_worker, pool, fetch, export_plan, performance, out_queue, abort)
+            queues.append(out_queue)
+
+        for table_spec, export_plan, out_queue in zip(tables, export_plans, queues):
+            try:
+                if parameterized:
+                    if export_plan is not None:
+                        write_parameterized_rows_to_file(_drain_queue(out_queue), table_spec,
+                                                         export_plan, file)
+                else:
+                    write_merge_statements_to_file(_drain_queue(out_queue) if out_queue else [],
+                                                   table_spec, file)
+            except Exception as e:
+                print(f"Error exporting {table_spec}: {e}")
+                raise
+    finally:
+        # Every queue has been drained when the export completes, so this only
+        # matters when it stops early, including on KeyboardInterrupt: workers
+        # blocked on a full queue give up and tables not started yet are dropped
+        abort.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+        pool.close(force=True)
+
+
 def validate_tables(tables: List[str]) -> List[str]:
     """Validate that all tables are in OWNER.TABLE format
 
@@ -625,10 +1372,20 @@ def main():
 Examples:
   python fastExportV2.py                    # Uses config.yaml in current directory
   python fastExportV2.py -c custom.yaml     # Uses custom configuration file
+  python fastExportV2.py -f parameterized   # Writes binds + values to a .params.pkl file
+  python fastExportV2.py -c target.yaml --replay oracle_merge_exports/merge_export.params.pkl
         """
     )
     parser.add_argument('--config', '-c', default='config.yaml',
                         help='Path to YAML configuration file (default: config.yaml)')
+    parser.add_argument('--batch-size', '-b', type=int,
+                        help='Rows combined into one MERGE statement '
+                             f"(overrides config, default: {_DEFAULT_PERFORMANCE['batch_size']})")
+    parser.add_argument('--format', '-f', choices=('sql', 'parameterized'), default='sql',
+                        help="'sql' writes MERGE statements with literal values, 'parameterized' writes "
+                             "one MERGE with binds per table plus its rows to a .params.pkl file (default: sql)")
+    parser.add_argument('--replay', metavar='FILE',
+                        help='Apply a parameterized export file to the configured database instead of exporting')
 
     args = parser.parse_args()
 
@@ -638,13 +1395,37 @@ Examples:
         print("Oracle Data Export Script - MERGE Statement Generator")
         print(f"{'='*70}\n")
 
-        config = load_config(args.config)
+        config = load_config(args.config, require_tables=not args.replay)
+        db_config = config['database']
+
+        if args.replay:
+            connection = connect_to_database(
+                db_config['username'],
+                db_config['password'],
+                db_config['dsn']
+            )
+            total_rows = replay_parameterized_export(connection, args.replay)
+            print(f"\nApplied {total_rows} rows from {args.replay}\n")
+            connection.close()
+            print("Database connection closed.\n")
+            return 0
 
         # Extract configuration values
-        db_config = config['database']
         tables = validate_tables(config['tables'])
         output_file = config['output']['file']
         config_shared_values = config.get('shared_values', {})
+        performance = config['performance']
+        if args.batch_size is not None:
+            performance['batch_size'] = args.batch_size
+        verbose = bool(config.get('verbose', False))
+        parameterized = args.format == 'parameterized'
+        if parameterized:
+            output_file = os.path.splitext(output_file)[0] + '.params.pkl'
+
+        # Create the output directory up front so a bad path fails before any prompting
+        output_dir = os.path.dirname(output_file)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
 
         # Connect to the database
         connection = connect_to_database(
@@ -656,26 +1437,35 @@ Examples:
         # Prompt for shared column values (merges config values with interactive input)
         shared_values = prompt_for_shared_columns(config_shared_values)
         processed_tables = set()
+        columns_cache = {}
 
         # Create or overwrite the output file with header
-        output_dir = os.path.dirname(output_file)
-        if output_dir:
-            os.makedirs(output_dir, exist_ok=True)
-
-        with open(output_file, 'w') as file:
-            file.write(f"-- Oracle MERGE statements export\n")
-            file.write(f"-- Generated on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            file.write(f"-- Configuration: {args.config}\n")
-            file.write("SET DEFINE OFF;\n\n")
-
-        # Export each table to the same file
-        for table in tables:
-            export_table_as_merge(connection, table, output_file, shared_values, processed_tables)
-
-        # Add final COMMIT statement
-        with open(output_file, 'a') as file:
-            file.write("\nCOMMIT;\n")
-            file.write(f"-- End of export for {len(tables)} tables\n")
+        # The file stays open for the whole export, every table is appended to it
+        with open(output_file, 'wb', buffering=1 << 20) as file:
+            generated = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            if parameterized:
+                _write_record(file, ('export', {'generated': generated, 'config': args.config}))
+            else:
+                file.write(f"-- Oracle MERGE statements export\n"
+                           f"-- Generated on {generated}\n"
+                           f"-- Configuration: {args.config}\n"
+                           "SET DEFINE OFF;\n\n".encode(_OUTPUT_ENCODING))
+
+            # Export each table to the same file
+            if performance['parallelism'] > 1 and len(tables) > 1:
+                export_tables_in_parallel(connection, db_config, tables, file, shared_values, processed_tables,
+                                          performance, verbose, columns_cache, args.format)
+            else:
+                export_table = export_table_parameterized if parameterized else export_table_as_merge
+                for table in tables:
+                    export_table(connection, table, file, shared_values, processed_tables, performance,
+                                 verbose, columns_cache)
+
+            # Add final COMMIT statement
+            if parameterized:
+                _write_record(file, ('commit', len(tables)))
+            else:
+                file.write(f"\nCOMMIT;\n-- End of export for {len(tables)} tables\n".encode(_OUTPUT_ENCODING))
 
         # Print summary
         print(f"\n{'='*70}")